@@ -14,15 +14,80 @@ Movie Ticket Booking System in Python, featuring both:
     - Manage showtimes
 """
 
+import argparse
+import atexit
 import json
 import os
+import re
+import sys
+from collections import UserDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import uuid
+from functools import lru_cache
+from random import choices, randint
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional; without it data is kept in a JSON file
+    msgpack = None
+
+DATA_FILE = "movie_system_data.msgpack" if msgpack else "movie_system_data.json"
+
+# One seat as "row letter,column", e.g. "A,1"; matched against a whole token
+SEAT_RE = re.compile(r'([A-Za-z])\s*,\s*(\d+)')
+
+FUN_FACTS = (
+    "Did you know? The longest movie ever made is over 85 hours long!",
+    "🍿 Popcorn was first sold in movie theaters in 1912!",
+    "🎬 The first public movie screening was in 1895.",
+    "🎥 The most expensive movie ever made is Pirates of the Caribbean: On Stranger Tides.",
+    "🦖 Jurassic Park's dinosaur roars were made from tortoise mating sounds!",
+    "🎭 The Oscar statuette's official name is the 'Academy Award of Merit'."
+)
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to compact JSON bytes."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode('utf-8')
+
+def _loads(buf: bytes):
+    """Parse JSON bytes."""
+    return orjson.loads(buf) if orjson else json.loads(buf)
+
+if hasattr(int, 'bit_count'):  # Python 3.10+
+    _popcount = int.bit_count
+else:
+    def _popcount(n: int) -> int:
+        """Number of set bits in n."""
+        return bin(n).count('1')
+
+def _booking_number(booking_id: str) -> int:
+    """Numeric value of a hex booking ID, or 0 for IDs in any other format."""
+    try:
+        return int(booking_id, 16)
+    except ValueError:
+        return 0
+
+def _highest_number(ids, prefix: str) -> int:
+    """Highest number in IDs of the form <prefix><number>, or 0 if there are none."""
+    pattern = re.compile(re.escape(prefix) + r'(\d+)')
+    return max((int(m.group(1)) for m in map(pattern.fullmatch, ids) if m), default=0)
+
+# Showtime IDs embed their movie ID: show_movie_001_002 belongs to movie_001
+_SHOWTIME_MOVIE_RE = re.compile(r'show_(movie_\d+)_')
 
 class Movie:
     """Represents a movie with its details."""
     
+    __slots__ = ('movie_id', 'title', 'genre', 'duration', 'rating',
+                 'description', 'price', 'showtimes')
+    
     def __init__(self, movie_id: str, title: str, genre: str, duration: int, 
                  rating: str, description: str = "", price: float = 12.50):
         self.movie_id = movie_id
@@ -61,6 +126,9 @@ class Movie:
 class ShowTime:
     """Represents a movie showtime with seating arrangement."""
     
+    __slots__ = ('showtime_id', 'movie_id', 'date', 'time', 'theater',
+                 'total_seats', 'booked_mask')
+    
     def __init__(self, showtime_id: str, movie_id: str, date: str, time: str, 
                  theater: str, total_seats: int = 50):
         self.showtime_id = showtime_id
@@ -69,25 +137,46 @@ class ShowTime:
         self.time = time
         self.theater = theater
         self.total_seats = total_seats
-        self.booked_seats = set()  # Set of booked seat numbers
+        self.booked_mask = 0  # Bit i is set when seat i+1 is booked
+    
+    def _seats_to_mask(self, seat_numbers: List[int]) -> Optional[int]:
+        """Get the bitmask for seat numbers, or None if any seat is out of range."""
+        mask = 0
+        for seat in seat_numbers:
+            if seat < 1 or seat > self.total_seats:
+                return None
+            mask |= 1 << (seat - 1)
+        return mask
+    
+    def is_booked(self, seat_number: int) -> bool:
+        """Check whether a seat is booked."""
+        return seat_number >= 1 and (self.booked_mask >> (seat_number - 1)) & 1 == 1
     
-    def get_available_seats(self) -> List[int]:
-        """Get list of available seat numbers."""
-        return [i for i in range(1, self.total_seats + 1) if i not in self.booked_seats]
+    def get_booked_seats(self) -> List[int]:
+        """Get list of booked seat numbers."""
+        mask = self.booked_mask
+        return [i + 1 for i in range(self.total_seats) if (mask >> i) & 1]
+    
+    @property
+    def available_count(self) -> int:
+        """Number of seats that are not booked."""
+        return self.total_seats - _popcount(self.booked_mask)
     
     def book_seats(self, seat_numbers: List[int]) -> bool:
         """Book specified seats if available."""
-        if all(seat in self.get_available_seats() for seat in seat_numbers):
-            self.booked_seats.update(seat_numbers)
-            return True
-        return False
+        requested = self._seats_to_mask(seat_numbers)
+        if requested is None or requested & self.booked_mask:
+            return False
+        self.booked_mask |= requested
+        return True
     
     def cancel_seats(self, seat_numbers: List[int]) -> bool:
         """Cancel booking for specified seats."""
-        if all(seat in self.booked_seats for seat in seat_numbers):
-            self.booked_seats.difference_update(seat_numbers)
-            return True
-        return False
+        requested = self._seats_to_mask(seat_numbers)
+        if requested is None or requested & self.booked_mask != requested:
+            return False
+        self.booked_mask &= ~requested
+        return True
     
     def to_dict(self) -> Dict:
         """Convert showtime to dictionary for JSON serialization."""
@@ -98,7 +187,7 @@ class ShowTime:
             'time': self.time,
             'theater': self.theater,
             'total_seats': self.total_seats,
-            'booked_seats': list(self.booked_seats)
+            'booked_seats': self.get_booked_seats()
         }
     
     @classmethod
@@ -108,12 +197,16 @@ class ShowTime:
             data['showtime_id'], data['movie_id'], data['date'],
             data['time'], data['theater'], data.get('total_seats', 50)
         )
-        showtime.booked_seats = set(data.get('booked_seats', []))
+        for seat in data.get('booked_seats', []):
+            showtime.booked_mask |= 1 << (seat - 1)
         return showtime
 
 class Booking:
     """Represents a ticket booking."""
     
+    __slots__ = ('booking_id', 'user_id', 'movie_title', 'showtime_id',
+                 'seat_numbers', 'total_amount', 'booking_date', 'status')
+    
     def __init__(self, booking_id: str, user_id: str, movie_title: str, 
                  showtime_id: str, seat_numbers: List[int], total_amount: float):
         self.booking_id = booking_id
@@ -152,6 +245,8 @@ class Booking:
 class User:
     """Represents a system user."""
     
+    __slots__ = ('user_id', 'username', 'email', 'is_admin', 'bookings')
+    
     def __init__(self, user_id: str, username: str, email: str, is_admin: bool = False):
         self.user_id = user_id
         self.username = username
@@ -176,66 +271,257 @@ class User:
         user.bookings = data.get('bookings', [])
         return user
 
+class _LazyRecords(UserDict):
+    """Dictionary of raw records that are turned into objects when first read."""
+    
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory  # e.g. Booking.from_dict
+    
+    def __getitem__(self, key):
+        value = self.data[key]
+        if type(value) is dict:
+            value = self.data[key] = self._factory(value)
+        return value
+    
+    def add_raw(self, key: str, record: Dict):
+        """Add a record that is only turned into an object when read."""
+        self.data[key] = record
+    
+    def rows(self) -> List[Dict]:
+        """Get all records as dictionaries, without building unread objects."""
+        return [value if type(value) is dict else value.to_dict()
+                for value in self.data.values()]
+
 class MovieBookingSystem:
     """Main system class that manages all operations."""
     
-    def __init__(self, data_file: str = "movie_system_data.json"):
+    def __init__(self, data_file: str = DATA_FILE):
         self.data_file = data_file
+        # Bookings and cancellations are appended here between full saves
+        self.journal_file = os.path.splitext(data_file)[0] + '_bookings.log'
+        self._journal = None  # Append handle, kept open until the next full save
         self.movies = {}  # movie_id -> Movie
         self.users = {}   # user_id -> User
-        self.bookings = {}  # booking_id -> Booking
+        self._by_username = {}  # username -> User
+        self.bookings = _LazyRecords(Booking.from_dict)  # booking_id -> Booking
+        self._id_index = {}  # movie/showtime ID -> ('movie', Movie) or ('showtime', (Movie, ShowTime))
+        self._bookings_index = {}  # user_id -> [booking_id, ...]
+        self._id_counters = {}  # ID prefix -> highest number issued so far
         self.current_user = None
+        self._dirty = False  # True when there are changes not yet saved
+        self._suspend_save = 0  # Depth of nested transaction() blocks
+        self._save_pending = False  # save_data() was called inside a transaction
+        self._pending_events = []  # Journal events held back by a transaction
         self.load_data()
+        # New booking IDs count up from the highest existing one
+        self._booking_counter = max(map(_booking_number, self.bookings), default=0)
+        atexit.register(self._flush)
     
     def load_data(self):
-        """Load data from JSON file."""
-        if os.path.exists(self.data_file):
+        """Load data from file, migrating an old JSON file to msgpack if needed."""
+        path = self.data_file
+        migrate = False
+        if msgpack is None and not path.endswith('.msgpack'):
+            # A msgpack file means an earlier run already migrated; the JSON file is stale
+            msgpack_file = os.path.splitext(path)[0] + '.msgpack'
+            if os.path.exists(msgpack_file):
+                raise RuntimeError(
+                    f"{msgpack_file} holds the current data but msgpack is not installed; "
+                    f"install msgpack rather than falling back to the older {path}"
+                )
+        if not os.path.exists(path) and path.endswith('.msgpack'):
+            legacy_file = os.path.splitext(path)[0] + '.json'
+            if os.path.exists(legacy_file):
+                path = legacy_file
+                migrate = True
+        
+        if os.path.exists(path):
             try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
+                data = self._read_file(path)
                 
                 # Load movies
                 for movie_data in data.get('movies', []):
-                    movie = Movie.from_dict(movie_data)
-                    self.movies[movie.movie_id] = movie
+                    self._add_movie(Movie.from_dict(movie_data))
                 
                 # Load users
                 for user_data in data.get('users', []):
-                    user = User.from_dict(user_data)
-                    self.users[user.user_id] = user
+                    self._add_user(User.from_dict(user_data))
                 
-                # Load bookings
+                # Load bookings (built on first access)
                 for booking_data in data.get('bookings', []):
-                    booking = Booking.from_dict(booking_data)
-                    self.bookings[booking.booking_id] = booking
+                    self.bookings.add_raw(booking_data['booking_id'], booking_data)
+                    self._index_booking(booking_data['user_id'], booking_data['booking_id'])
+                
+                self._replay_journal()
+                
+                if migrate:
+                    self.save_data()
                     
-            except (json.JSONDecodeError, KeyError) as e:
+            except (ValueError, KeyError) as e:
                 print(f"Error loading data: {e}. Starting with fresh data.")
                 self._initialize_sample_data()
         else:
             self._initialize_sample_data()
     
-    def save_data(self):
-        """Save data to JSON file."""
+    def _read_file(self, path: str) -> Dict:
+        """Read raw data from a msgpack or JSON file."""
+        with open(path, 'rb') as f:
+            buf = f.read()
+        if path.endswith('.msgpack'):
+            return msgpack.unpackb(buf, raw=False)
+        return _loads(buf)
+    
+    def _replay_journal(self):
+        """Re-apply booking events logged since the last full save."""
+        if not os.path.exists(self.journal_file):
+            return
+        
+        with open(self.journal_file, 'rb') as f:
+            lines = f.read().splitlines()
+        
+        for line in lines:
+            try:
+                event = _loads(line)
+            except ValueError:
+                break  # Partially written last line
+            
+            # A bad entry is skipped on its own; it must not abort loading the data
+            try:
+                self._replay_event(event)
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                print(f"⚠️ Dropped a malformed journal entry ({e!r}): {line.decode('utf-8', 'replace')}")
+        
+        self._dirty = True
+    
+    def _replay_event(self, event: Dict):
+        """Re-apply one journal event, reporting it if it can no longer be applied."""
+        if event['op'] == 'book':
+            booking = Booking.from_dict(event['booking'])
+            if booking.booking_id in self.bookings:
+                return
+            user = self.users.get(booking.user_id)
+            movie, showtime = self.find_showtime(booking.showtime_id)
+            if not user:
+                print(f"⚠️ Dropped booking {booking.booking_id} from the journal: "
+                      f"unknown user {booking.user_id}.")
+            elif not showtime:
+                print(f"⚠️ Dropped booking {booking.booking_id} from the journal: "
+                      f"showtime {booking.showtime_id} no longer exists.")
+            elif not showtime.book_seats(booking.seat_numbers):
+                print(f"⚠️ Dropped booking {booking.booking_id} from the journal: "
+                      f"its seats are already taken.")
+            else:
+                self.bookings[booking.booking_id] = booking
+                self._index_booking(booking.user_id, booking.booking_id)
+                user.bookings.append(booking.booking_id)
+        
+        elif event['op'] == 'cancel':
+            booking = self.bookings.get(event['booking_id'])
+            if booking and booking.status == "Cancelled":
+                return
+            movie, showtime = self.find_showtime(booking.showtime_id) if booking else (None, None)
+            if showtime and showtime.cancel_seats(booking.seat_numbers):
+                booking.status = "Cancelled"
+            else:
+                print(f"⚠️ Dropped cancellation of booking {event['booking_id']} "
+                      f"from the journal: the booking or its showtime no longer exists.")
+        
+        else:
+            print(f"⚠️ Dropped journal entry with unknown operation {event['op']!r}.")
+    
+    def _index_booking(self, user_id: str, booking_id: str):
+        """Add a booking to the per-user booking index."""
+        self._bookings_index.setdefault(user_id, []).append(booking_id)
+    
+    def _log_event(self, event: Dict):
+        """Append a booking event to the journal file."""
+        if self._suspend_save:
+            self._pending_events.append(event)
+            return
+        self._write_events([event])
+    
+    def _write_events(self, events: List[Dict]):
+        """Append events to the journal file in a single write."""
+        if self._journal is None:
+            self._journal = open(self.journal_file, 'ab')
+        self._journal.write(b"".join(_dumps(event) + b"\n" for event in events))
+        self._journal.flush()
+    
+    @contextmanager
+    def transaction(self):
+        """Hold back saving and journal writes until the outermost block exits."""
+        self._suspend_save += 1
+        try:
+            yield self
+        finally:
+            self._suspend_save -= 1
+            if not self._suspend_save:
+                if self._pending_events:
+                    self._write_events(self._pending_events)
+                    self._pending_events = []
+                if self._save_pending:
+                    self._save_pending = False
+                    self.save_data()
+    
+    def _mark_dirty(self):
+        """Record that there are changes to save on the next flush."""
+        self._dirty = True
+    
+    def _flush(self):
+        """Save data if anything changed since the last save."""
+        if self._dirty:
+            self.save_data()
+    
+    def save_data(self, pretty: bool = False):
+        """Save data to file (msgpack or JSON, depending on the file extension).
+        
+        JSON is written compactly unless pretty is True. Inside transaction()
+        the save happens when the transaction ends.
+        """
+        if self._suspend_save:
+            self._save_pending = True
+            self._dirty = True
+            return
+        
         data = {
             'movies': [movie.to_dict() for movie in self.movies.values()],
             'users': [user.to_dict() for user in self.users.values()],
-            'bookings': [booking.to_dict() for booking in self.bookings.values()]
+            'bookings': self.bookings.rows()
         }
         
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if self.data_file.endswith('.msgpack'):
+            with open(self.data_file, 'wb') as f:
+                f.write(msgpack.packb(data, use_bin_type=True))
+        elif orjson:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(self.data_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+        else:
+            with open(self.data_file, 'w') as f:
+                if pretty:
+                    json.dump(data, f, indent=2)
+                else:
+                    json.dump(data, f, separators=(',', ':'))
+        
+        # The snapshot now includes everything in the journal
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self._dirty = False
     
     def _initialize_sample_data(self):
         """Initialize system with sample data."""
         # Create sample admin user
-        admin_user = User("admin_001", "admin", "admin@cinema.com", True)
-        self.users[admin_user.user_id] = admin_user
+        self._add_user(User("admin_001", "admin", "admin@cinema.com", True))
         
         # Create sample regular user
 
-        regular_user = User("user_001", "SUDIP", "sudip@email.com", False)
-        self.users[regular_user.user_id] = regular_user
+        self._add_user(User("user_001", "SUDIP", "sudip@email.com", False))
         
         # Create sample movies with showtimes
         sample_movies = [
@@ -275,14 +561,15 @@ class MovieBookingSystem:
         
         theaters = ["Theater A", "Theater B", "Theater C"]
         times = ["10:00", "13:30", "16:00", "19:30", "22:00"]
+        today = datetime.now()
+        dates = [(today + timedelta(days=day)).strftime("%Y-%m-%d") for day in range(3)]
         
         for i, movie_data in enumerate(sample_movies):
             movie_id = f"movie_{i+1:03d}"
             movie = Movie(movie_id, **movie_data)
             
             # Add showtimes for next 3 days
-            for day in range(3):
-                date = (datetime.now() + timedelta(days=day)).strftime("%Y-%m-%d")
+            for day, date in enumerate(dates):
                 for j, time in enumerate(times[:3]):  # 3 showtimes per day
                     showtime_id = f"show_{movie_id}_{day}_{j}"
                     theater = theaters[j % len(theaters)]
@@ -292,16 +579,54 @@ class MovieBookingSystem:
                     )
                     movie.showtimes.append(showtime)
             
-            self.movies[movie_id] = movie
+            self._add_movie(movie)
         
         self.save_data()
     
+    def _add_movie(self, movie: Movie):
+        """Add a movie and its showtimes to the movie map and the ID index."""
+        old = self.movies.get(movie.movie_id)
+        if old is not None:
+            for showtime in old.showtimes:
+                self._id_index.pop(showtime.showtime_id, None)
+        self.movies[movie.movie_id] = movie
+        self._id_index[movie.movie_id] = ('movie', movie)
+        for showtime in movie.showtimes:
+            self._id_index[showtime.showtime_id] = ('showtime', (movie, showtime))
+    
+    def _issued_ids(self):
+        """Iterate over every movie and showtime ID still in use, including by old bookings."""
+        for movie in self.movies.values():
+            yield movie.movie_id
+            for showtime in movie.showtimes:
+                yield showtime.showtime_id
+        for booking in self.bookings.rows():
+            showtime_id = booking['showtime_id']
+            yield showtime_id
+            match = _SHOWTIME_MOVIE_RE.match(showtime_id)
+            if match:
+                yield match.group(1)
+    
+    def _new_id(self, prefix: str) -> str:
+        """Issue the next <prefix><number> ID; a number is never handed out twice."""
+        number = self._id_counters.get(prefix)
+        if number is None:
+            number = _highest_number(self._issued_ids(), prefix)
+        number += 1
+        self._id_counters[prefix] = number
+        return f"{prefix}{number:03d}"
+    
+    def _add_user(self, user: User):
+        """Add a user to the user and username maps."""
+        self.users[user.user_id] = user
+        self._by_username.setdefault(user.username, user)
+    
     def login(self, username: str) -> bool:
         """Login user by username."""
-        for user in self.users.values():
-            if user.username == username:
-                self.current_user = user
-                return True
+        user = self._by_username.get(username)
+        if user:
+            self.current_user = user
+            return True
         return False
     
     def logout(self):
@@ -311,13 +636,11 @@ class MovieBookingSystem:
     def register_user(self, username: str, email: str) -> bool:
         """Register a new user."""
         # Check if username already exists
-        for user in self.users.values():
-            if user.username == username:
-                return False
+        if username in self._by_username:
+            return False
         
         user_id = f"user_{len(self.users)+1:03d}"
-        user = User(user_id, username, email)
-        self.users[user_id] = user
+        self._add_user(User(user_id, username, email))
         self.save_data()
         return True
     
@@ -332,29 +655,30 @@ class MovieBookingSystem:
             return self.movies[movie_id].showtimes
         return []
     
+    def lookup(self, item_id: str) -> Optional[Tuple[str, object]]:
+        """Get ('movie', Movie) or ('showtime', (Movie, ShowTime)) for an ID, or None."""
+        return self._id_index.get(item_id)
+    
+    def find_showtime(self, showtime_id: str) -> Tuple[Optional[Movie], Optional[ShowTime]]:
+        """Get the movie and showtime for a showtime ID, or (None, None)."""
+        kind, value = self._id_index.get(showtime_id, (None, None))
+        if kind != 'showtime':
+            return None, None
+        return value
+    
     def book_tickets(self, showtime_id: str, seat_numbers: List[int]) -> Optional[str]:
         """Book tickets for a showtime."""
         if not self.current_user:
             return None
         
-        # Find the showtime and movie
-        showtime = None
-        movie = None
-        for m in self.movies.values():
-            for st in m.showtimes:
-                if st.showtime_id == showtime_id:
-                    showtime = st
-                    movie = m
-                    break
-            if showtime:
-                break
-        
+        movie, showtime = self.find_showtime(showtime_id)
         if not showtime or not movie:
             return None
         
         # Check if seats are available and book them
         if showtime.book_seats(seat_numbers):
-            booking_id = str(uuid.uuid4())[:8]  # Short ID for display
+            self._booking_counter += 1
+            booking_id = f"{self._booking_counter:08x}"  # Short ID for display
             total_amount = len(seat_numbers) * movie.price
             
             booking = Booking(
@@ -364,7 +688,9 @@ class MovieBookingSystem:
             
             self.bookings[booking_id] = booking
             self.current_user.bookings.append(booking_id)
-            self.save_data()
+            self._index_booking(self.current_user.user_id, booking_id)
+            self._log_event({'op': 'book', 'booking': booking.to_dict()})
+            self._mark_dirty()
             
             return booking_id
         
@@ -383,14 +709,13 @@ class MovieBookingSystem:
             not self.current_user.is_admin):
             return False
         
-        # Find and cancel seats in showtime
-        for movie in self.movies.values():
-            for showtime in movie.showtimes:
-                if showtime.showtime_id == booking.showtime_id:
-                    if showtime.cancel_seats(booking.seat_numbers):
-                        booking.status = "Cancelled"
-                        self.save_data()
-                        return True
+        # Cancel seats in showtime
+        movie, showtime = self.find_showtime(booking.showtime_id)
+        if showtime and showtime.cancel_seats(booking.seat_numbers):
+            booking.status = "Cancelled"
+            self._log_event({'op': 'cancel', 'booking_id': booking_id})
+            self._mark_dirty()
+            return True
         
         return False
     
@@ -399,8 +724,8 @@ class MovieBookingSystem:
         if not self.current_user:
             return []
         
-        return [self.bookings[booking_id] for booking_id in self.current_user.bookings 
-                if booking_id in self.bookings]
+        return [self.bookings[booking_id]
+                for booking_id in self._bookings_index.get(self.current_user.user_id, ())]
     
     # Admin Methods
     def add_movie(self, title: str, genre: str, duration: int, rating: str, 
@@ -409,9 +734,8 @@ class MovieBookingSystem:
         if not self.current_user or not self.current_user.is_admin:
             return None
         
-        movie_id = f"movie_{len(self.movies)+1:03d}"
-        movie = Movie(movie_id, title, genre, duration, rating, description, price)
-        self.movies[movie_id] = movie
+        movie_id = self._new_id("movie_")
+        self._add_movie(Movie(movie_id, title, genre, duration, rating, description, price))
         self.save_data()
         return movie_id
     
@@ -420,8 +744,12 @@ class MovieBookingSystem:
         if not self.current_user or not self.current_user.is_admin:
             return False
         
-        if movie_id in self.movies:
+        kind, movie = self._id_index.get(movie_id, (None, None))
+        if kind == 'movie':
+            del self._id_index[movie_id]
             del self.movies[movie_id]
+            for showtime in movie.showtimes:
+                self._id_index.pop(showtime.showtime_id, None)
             self.save_data()
             return True
         return False
@@ -432,12 +760,14 @@ class MovieBookingSystem:
         if not self.current_user or not self.current_user.is_admin:
             return None
         
-        if movie_id not in self.movies:
+        kind, movie = self._id_index.get(movie_id, (None, None))
+        if kind != 'movie':
             return None
         
-        showtime_id = f"show_{movie_id}_{len(self.movies[movie_id].showtimes)+1:03d}"
+        showtime_id = self._new_id(f"show_{movie_id}_")
         showtime = ShowTime(showtime_id, movie_id, date, time, theater, total_seats)
-        self.movies[movie_id].showtimes.append(showtime)
+        movie.showtimes.append(showtime)
+        self._id_index[showtime_id] = ('showtime', (movie, showtime))
         self.save_data()
         return showtime_id
     
@@ -446,12 +776,13 @@ class MovieBookingSystem:
         if not self.current_user or not self.current_user.is_admin:
             return False
         
-        for movie in self.movies.values():
-            for i, showtime in enumerate(movie.showtimes):
-                if showtime.showtime_id == showtime_id:
-                    del movie.showtimes[i]
-                    self.save_data()
-                    return True
+        kind, value = self._id_index.get(showtime_id, (None, None))
+        if kind == 'showtime':
+            del self._id_index[showtime_id]
+            movie, showtime = value
+            movie.showtimes.remove(showtime)
+            self.save_data()
+            return True
         return False
     
     def get_all_bookings(self) -> List[Booking]:
@@ -462,390 +793,506 @@ class MovieBookingSystem:
         return list(self.bookings.values())
 
 
-def wait_for_user():
-    """Wait for user to press Enter before continuing."""
-    input("\n🔄 Press Enter to return to menu...")
+@lru_cache(maxsize=512)
+def _render_seat_map(total_seats: int, booked_mask: int) -> str:
+    """Render the seat map for a seat count and booked-seat bitmask."""
+    seats_per_row = 10
+    total_rows = (total_seats + seats_per_row - 1) // seats_per_row
+    parts = [
+        "\n💺 SEAT MAP (🎟️ Available, ❌ Booked):\n",
+        "     " + " ".join(f"{col+1:2d}" for col in range(seats_per_row)) + "\n"
+    ]
+    for row in range(total_rows):
+        parts.append(f" {chr(ord('A') + row)} : ")
+        for col in range(seats_per_row):
+            seat_num = row * seats_per_row + col + 1
+            if seat_num <= total_seats:
+                parts.append("❌ " if (booked_mask >> (seat_num - 1)) & 1 else "🎟️ ")
+            else:
+                parts.append("   ")
+        parts.append("\n")
+    parts.append("\n👉 To book, enter seats as e.g. A,1 or B,5 (row letter, column number). Multiple seats: A,1;B,2;C,3\n")
+    return "".join(parts)
 
-def main():
-    """Main application entry point."""
-    system = MovieBookingSystem()
+class Console:
+    """Where menu answers are read from, and whether to pause between screens."""
+    
+    __slots__ = ('readline', 'pause')
+    
+    def __init__(self, readline=None, pause: bool = True):
+        # Bound once so each prompt skips the sys.stdin attribute lookups
+        self.readline = readline or sys.stdin.readline
+        self.pause = pause
+    
+    def prompt(self, message: str) -> str:
+        """Show a prompt and return the user's answer with surrounding whitespace removed."""
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        line = self.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        return line.strip()
     
-    def print_header():
-        print("\n" + "="*60)
-        print("🎬 MOVIE TICKET BOOKING SYSTEM 🎬")
-        print("="*60)
-        print(r"""
+    def wait_for_user(self):
+        """Wait for user to press Enter before continuing (skipped in batch mode)."""
+        if self.pause:
+            self.prompt("\n🔄 Press Enter to return to menu...")
+
+# Non-negative decimals as float() accepts them: 12, 12.5, .5 and 12.
+_DECIMAL_RE = re.compile(r'\d*\.?\d+|\d+\.')
+
+def _parse_int(text: str, default: Optional[int] = None) -> Optional[int]:
+    """Parse a non-negative whole number, or return default if text is not one."""
+    text = text.strip()
+    return int(text) if text.isdecimal() else default
+
+def _parse_float(text: str, default: Optional[float] = None) -> Optional[float]:
+    """Parse a non-negative decimal number, or return default if text is not one."""
+    text = text.strip()
+    return float(text) if _DECIMAL_RE.fullmatch(text) else default
+
+def _split_seat_input(seat_input: str) -> List[str]:
+    """Split seat input into "row,column" tokens: A,1 / A,1;B,2 / A,1,B,2."""
+    if ';' in seat_input:
+        return [part.strip() for part in seat_input.split(';') if part.strip()]
+    if seat_input.count(',') > 1:
+        # A,1,B,2 is read as A,1;B,2
+        parts = [part.strip() for part in seat_input.split(',')]
+        return [f"{parts[i]},{parts[i+1]}" for i in range(0, len(parts) - 1, 2)]
+    return [seat_input] if seat_input else []
+
+def print_header():
+    """Print the welcome banner."""
+    sys.stdout.write("\n".join([
+        "\n" + "="*60,
+        "🎬 MOVIE TICKET BOOKING SYSTEM 🎬",
+        "="*60,
+        r"""
    ____  __  __  ____  _   _  ___  ____     _   _  _   _  ____  _  __
   |  _ \|  \/  |/ ___|| | | |/ _ \|  _ \   | | | || | | |/ ___|| |/ /
   | | | | |\/| | |  _ | |_| | | | | |_) |  | |_| || |_| | |  _ | ' / 
   | |_| | |  | | |_| ||  _  | |_| |  _ <   |  _  ||  _  | |_| || . \ 
   |____/|_|  |_|\____||_| |_|\___/|_| \_\  |_| |_||_| |_|\____||_|\_\
-        """
-        )
-        print("🍿 Welcome to the most fun way to book your movie tickets! 🍿")
-    
-    def print_menu():
-        if system.current_user:
-            role = "ADMIN" if system.current_user.is_admin else "USER"
-            print(f"\n👋 Welcome, {system.current_user.username}! ({role})")
-            print("📋 MENU OPTIONS:")
-            print("1. 🎬 Browse Movies")
-            print("2. 🎭 View Movie Showtimes")
-            print("3. 🎫 Book Tickets")
-            print("4. 📋 My Bookings")
-            print("5. ❌ Cancel Booking")
-            
-            if system.current_user.is_admin:
-                print("--- ADMIN OPTIONS ---")
-                print("6. ➕ Add Movie")
-                print("7. ➖ Remove Movie")
-                print("8. 🕐 Add Showtime")
-                print("9. 🗑️ Remove Showtime")
-                print("10. 📊 View All Bookings")
-                print("11. 🚪 Logout")
-            else:
-                print("6. 🚪 Logout")
-        else:
-            print("\n📋 MAIN MENU:")
-            print("1. 🔐 Login")
-            print("2. 📝 Register")
-            print("3. 👋 Exit")
-    
-    def display_movies():
-        movies = system.browse_movies()
-        if not movies:
-            print("❌ No movies available.")
-            return
-        
-        print("\n🎬 AVAILABLE MOVIES:")
-        print("="*80)
-        import random
-        fun_facts = [
-            "Did you know? The longest movie ever made is over 85 hours long!",
-            "🍿 Popcorn was first sold in movie theaters in 1912!",
-            "🎬 The first public movie screening was in 1895.",
-            "🎥 The most expensive movie ever made is Pirates of the Caribbean: On Stranger Tides.",
-            "🦖 Jurassic Park's dinosaur roars were made from tortoise mating sounds!",
-            "🎭 The Oscar statuette's official name is the 'Academy Award of Merit'."
-        ]
-        for i, movie in enumerate(movies, 1):
-            print(f"{i}. {movie.title}")
-            print(f"   ID: {movie.movie_id}")
-            print(f"   Genre: {movie.genre}")
-            print(f"   Duration: {movie.duration} minutes")
-            print(f"   Rating: {movie.rating}")
-            # Always show price in dollars (force $ even if old data has ₹)
-            price_str = f"${movie.price:.2f}"
-            print(f"   Price: {price_str}")
-            print(f"   Description: {movie.description}")
-            # Show a fun fact for each movie
-            print(f"💡 Fun Fact: {random.choice(fun_facts)}")
-            print("-" * 80)
-    
-    def display_showtimes(movie_id: str):
-        showtimes = system.get_movie_showtimes(movie_id)
-        if not showtimes:
-            print("❌ No showtimes available for this movie.")
-            return
-        
-        movie = system.movies.get(movie_id)
-        if movie:
-            print(f"\n🎭 SHOWTIMES for '{movie.title}':")
-            print("="*80)
-            for i, showtime in enumerate(showtimes, 1):
-                available = len(showtime.get_available_seats())
-                print(f"{i}. Showtime ID: {showtime.showtime_id}")
-                print(f"   📅 Date: {showtime.date}")
-                print(f"   🕐 Time: {showtime.time}")
-                print(f"   🏢 Theater: {showtime.theater}")
-                print(f"   💺 Available Seats: {available}/{showtime.total_seats}")
-                print(f"   💰 Price: ${movie.price:.2f} per seat")
-                print("-" * 80)
-    
-    def display_bookings(bookings: List[Booking]):
-        if not bookings:
-            print("❌ No bookings found.")
+        """,
+        "🍿 Welcome to the most fun way to book your movie tickets! 🍿"
+    ]) + "\n")
+
+# The option lists never change, so they are encoded once at import
+_MENU_OPTIONS = [
+    "📋 MENU OPTIONS:",
+    "1. 🎬 Browse Movies",
+    "2. 🎭 View Movie Showtimes",
+    "3. 🎫 Book Tickets",
+    "4. 📋 My Bookings",
+    "5. ❌ Cancel Booking"
+]
+_GUEST_MENU_BYTES = ("\n".join([
+    "\n📋 MAIN MENU:",
+    "1. 🔐 Login",
+    "2. 📝 Register",
+    "3. 👋 Exit"
+]) + "\n").encode("utf-8")
+_USER_MENU_BYTES = ("\n".join(_MENU_OPTIONS + [
+    "6. 🚪 Logout"
+]) + "\n").encode("utf-8")
+_ADMIN_MENU_BYTES = ("\n".join(_MENU_OPTIONS + [
+    "--- ADMIN OPTIONS ---",
+    "6. ➕ Add Movie",
+    "7. ➖ Remove Movie",
+    "8. 🕐 Add Showtime",
+    "9. 🗑️ Remove Showtime",
+    "10. 📊 View All Bookings",
+    "11. 🚪 Logout"
+]) + "\n").encode("utf-8")
+
+def write_bytes(data: bytes):
+    """Write pre-encoded UTF-8 text to stdout, bypassing the text layer when possible."""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    encoding = (getattr(sys.stdout, 'encoding', None) or '').lower()
+    if buffer is None or encoding not in ('utf-8', 'utf8'):
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    # Anything already written through the text layer must come out first
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+def print_menu(system: MovieBookingSystem, is_admin: bool = False):
+    """Print the menu for the current user (or the main menu when logged out)."""
+    if system.current_user:
+        role = "ADMIN" if is_admin else "USER"
+        sys.stdout.write(f"\n👋 Welcome, {system.current_user.username}! ({role})\n")
+        write_bytes(_ADMIN_MENU_BYTES if is_admin else _USER_MENU_BYTES)
+    else:
+        write_bytes(_GUEST_MENU_BYTES)
+
+def display_movies(system: MovieBookingSystem):
+    """Print all movies with a fun fact for each."""
+    movies = system.browse_movies()
+    if not movies:
+        print("❌ No movies available.")
+        return
+    
+    lines = ["\n🎬 AVAILABLE MOVIES:", "="*80]
+    facts = choices(FUN_FACTS, k=len(movies))
+    for i, (movie, fact) in enumerate(zip(movies, facts), 1):
+        lines.append(f"{i}. {movie.title}")
+        lines.append(f"   ID: {movie.movie_id}")
+        lines.append(f"   Genre: {movie.genre}")
+        lines.append(f"   Duration: {movie.duration} minutes")
+        lines.append(f"   Rating: {movie.rating}")
+        # Always show price in dollars (force $ even if old data has ₹)
+        lines.append(f"   Price: ${movie.price:.2f}")
+        lines.append(f"   Description: {movie.description}")
+        # Show a fun fact for each movie
+        lines.append(f"💡 Fun Fact: {fact}")
+        lines.append("-" * 80)
+    print("\n".join(lines))
+
+def display_showtimes(system: MovieBookingSystem, movie_id: str):
+    """Print the showtimes of a movie."""
+    showtimes = system.get_movie_showtimes(movie_id)
+    if not showtimes:
+        print("❌ No showtimes available for this movie.")
+        return
+    
+    movie = system.movies.get(movie_id)
+    if movie:
+        lines = [f"\n🎭 SHOWTIMES for '{movie.title}':", "="*80]
+        for i, showtime in enumerate(showtimes, 1):
+            lines.append(f"{i}. Showtime ID: {showtime.showtime_id}")
+            lines.append(f"   📅 Date: {showtime.date}")
+            lines.append(f"   🕐 Time: {showtime.time}")
+            lines.append(f"   🏢 Theater: {showtime.theater}")
+            lines.append(f"   💺 Available Seats: {showtime.available_count}/{showtime.total_seats}")
+            lines.append(f"   💰 Price: ${movie.price:.2f} per seat")
+            lines.append("-" * 80)
+        print("\n".join(lines))
+
+def display_bookings(bookings: List[Booking]):
+    """Print a list of bookings."""
+    if not bookings:
+        print("❌ No bookings found.")
+        return
+    
+    lines = ["\n🎫 BOOKINGS:", "="*80]
+    for i, booking in enumerate(bookings, 1):
+        lines.append(f"{i}. Booking ID: {booking.booking_id}")
+        lines.append(f"   🎬 Movie: {booking.movie_title}")
+        lines.append(f"   🎭 Showtime: {booking.showtime_id}")
+        lines.append(f"   💺 Seats: {', '.join(map(str, booking.seat_numbers))}")
+        lines.append(f"   💰 Total: ${booking.total_amount:.2f}")
+        lines.append(f"   📅 Date: {booking.booking_date}")
+        lines.append(f"   📊 Status: {booking.status}")
+        # Loyalty points: 1 point per seat
+        lines.append(f"   🏆 Loyalty Points Earned: {len(booking.seat_numbers)}")
+        lines.append("-" * 80)
+    print("\n".join(lines))
+
+def get_seat_display(showtime: ShowTime) -> str:
+    """Generate visual seat map with row/column labels and emojis."""
+    return _render_seat_map(showtime.total_seats, showtime.booked_mask)
+
+# Seat map and price shown before asking which seats to book
+_BOOKING_SUMMARY = "{seat_map}\n💰 Price per seat: ${price:.2f}\n"
+
+# Menu handlers: each takes the system and the console and returns True to exit the program
+
+def handle_login(system: MovieBookingSystem, console: Console):
+    """Log in by username (admin also needs a password)."""
+    username = console.prompt("👤 Enter username: ")
+    if username == 'admin':
+        password = console.prompt("🔑 Enter password for admin: ")
+        if password != '12345':
+            print("❌ Incorrect password for admin.")
+            console.wait_for_user()
             return
-        
-        print("\n🎫 BOOKINGS:")
-        print("="*80)
-        for i, booking in enumerate(bookings, 1):
-            print(f"{i}. Booking ID: {booking.booking_id}")
-            print(f"   🎬 Movie: {booking.movie_title}")
-            print(f"   🎭 Showtime: {booking.showtime_id}")
-            print(f"   💺 Seats: {', '.join(map(str, booking.seat_numbers))}")
-            print(f"   💰 Total: ${booking.total_amount:.2f}")
-            print(f"   📅 Date: {booking.booking_date}")
-            print(f"   📊 Status: {booking.status}")
-            # Loyalty points: 1 point per seat
-            points = len(booking.seat_numbers)
-            print(f"   🏆 Loyalty Points Earned: {points}")
-            print("-" * 80)
-    
-    def get_seat_display(showtime: ShowTime) -> str:
-        """Generate visual seat map with row/column labels and emojis."""
-        seats_per_row = 10
-        total_rows = (showtime.total_seats + seats_per_row - 1) // seats_per_row
-        display = "\n💺 SEAT MAP (🎟️ Available, ❌ Booked):\n"
-        display += "     " + " ".join(f"{col+1:2d}" for col in range(seats_per_row)) + "\n"
-        for row in range(total_rows):
-            row_letter = chr(ord('A') + row)
-            display += f" {row_letter} : "
-            for col in range(seats_per_row):
-                seat_num = row * seats_per_row + col + 1
-                if seat_num <= showtime.total_seats:
-                    if seat_num in showtime.booked_seats:
-                        display += "❌ "
-                    else:
-                        display += "🎟️ "
-                else:
-                    display += "   "
-            display += "\n"
-        display += "\n👉 To book, enter seats as e.g. A,1 or B,5 (row letter, column number). Multiple seats: A,1;B,2;C,3\n"
-        return display
+    if system.login(username):
+        print("✅ Login successful!")
+    else:
+        print("❌ Invalid username. Please try again.")
+    console.wait_for_user()
+
+def handle_register(system: MovieBookingSystem, console: Console):
+    """Register a new user."""
+    username = console.prompt("👤 Enter username: ")
+    email = console.prompt("📧 Enter email: ")
+    if system.register_user(username, email):
+        print("✅ Registration successful! You can now login.")
+    else:
+        print("❌ Username already exists. Please choose a different one.")
+    console.wait_for_user()
+
+def handle_exit(system: MovieBookingSystem, console: Console):
+    """Say goodbye and exit the program."""
+    print("👋 Thank you for using Movie Ticket Booking System!")
+    return True
+
+def handle_browse(system: MovieBookingSystem, console: Console):
+    """Show all movies."""
+    display_movies(system)
+    console.wait_for_user()
+
+def handle_showtimes(system: MovieBookingSystem, console: Console):
+    """Show the showtimes of a movie."""
+    movie_id = console.prompt("🎬 Enter movie ID: ")
+    display_showtimes(system, movie_id)
+    console.wait_for_user()
+
+def handle_book(system: MovieBookingSystem, console: Console):
+    """Pick seats on the seat map and book them."""
+    showtime_id = console.prompt("🎭 Enter showtime ID: ")
     
-    print_header()
-    print("🎭 Welcome to the Movie Ticket Booking System!")
-    print("ℹ️  Demo accounts: 'admin' (admin) or 'sudip' (user)")
-    # Easter egg: popcorn command
-    print("🍀 Type 'popcorn' at any menu for a surprise!")
+    # Find and display showtime details
+    movie, showtime = system.find_showtime(showtime_id)
+    
+    if not showtime or not movie:
+        print("❌ Invalid showtime ID.")
+        console.wait_for_user()
+        return
+    
+    sys.stdout.write(_BOOKING_SUMMARY.format(seat_map=get_seat_display(showtime), price=movie.price))
+    
+    seat_input = console.prompt("💺 Enter seat(s) (e.g. A,1 or B,2;C,3): ")
+    # Accept both comma or semicolon as separator for multiple seats
+    seat_numbers = []
+    invalid_seats = []
+    booked_seats = []
+    for seat_str in _split_seat_input(seat_input):
+        match = SEAT_RE.fullmatch(seat_str)
+        if not match:
+            invalid_seats.append(seat_str)
+            continue
+        row_letter, col_str = match.groups()
+        row = ord(row_letter.upper()) - ord('A')
+        col = int(col_str) - 1
+        if col < 0 or col >= 10:
+            invalid_seats.append(seat_str)
+            continue
+        seat_num = row * 10 + col + 1
+        if seat_num > showtime.total_seats:
+            invalid_seats.append(seat_str)
+            continue
+        if showtime.is_booked(seat_num):
+            booked_seats.append(seat_str)
+            continue
+        seat_numbers.append(seat_num)
+    if invalid_seats:
+        print(f"❌ Invalid seat(s) format or out of range: {invalid_seats}\n   ➡️  Please enter as A,1 or B,2;C,3 (row letter, column number; separate multiple seats with semicolons or commas)")
+        console.wait_for_user()
+        return
+    if booked_seats:
+        print(f"❌ Seats already booked: {booked_seats}")
+        console.wait_for_user()
+        return
+    total_cost = len(seat_numbers) * movie.price
+    print(f"💰 Total cost: ${total_cost:.2f}")
+    confirm = console.prompt("✅ Confirm booking? (y/n): ").lower()
+    if confirm == 'y':
+        with system.transaction():
+            booking_id = system.book_tickets(showtime_id, seat_numbers)
+        if booking_id:
+            print(f"🎉 Booking successful! Booking ID: {booking_id}")
+            # Mini-game: Lucky Draw
+            if randint(1, 5) == 3:
+                print("🎲 Lucky Draw! You won a free popcorn coupon! 🍿 Use code: POPCORN2025")
+        else:
+            print("❌ Booking failed. Please try again.")
+    else:
+        print("❌ Booking cancelled.")
+    console.wait_for_user()
+
+def handle_my_bookings(system: MovieBookingSystem, console: Console):
+    """Show the current user's bookings."""
+    display_bookings(system.get_user_bookings())
+    console.wait_for_user()
+
+def handle_cancel(system: MovieBookingSystem, console: Console):
+    """Cancel a booking by ID."""
+    booking_id = console.prompt("🎫 Enter booking ID to cancel: ")
+    if system.cancel_booking(booking_id):
+        print("✅ Booking cancelled successfully!")
+    else:
+        print("❌ Failed to cancel booking. Please check booking ID.")
+    console.wait_for_user()
+
+def handle_logout(system: MovieBookingSystem, console: Console):
+    """Log out the current user."""
+    system.logout()
+    print("👋 Logged out successfully!")
+    console.wait_for_user()
+
+def handle_add_movie(system: MovieBookingSystem, console: Console):
+    """Add a new movie (admin)."""
+    print("\n➕ ADD NEW MOVIE:")
+    title = console.prompt("🎬 Movie title: ")
+    genre = console.prompt("🎭 Genre: ")
+    duration = _parse_int(console.prompt("⏱️ Duration (minutes): "))
+    if duration is None:
+        print("❌ Invalid duration. Please enter a whole number of minutes.")
+        console.wait_for_user()
+        return
+    rating = console.prompt("⭐ Rating (G/PG/PG-13/R): ")
+    description = console.prompt("📝 Description: ")
+    price = _parse_float(console.prompt("💰 Ticket price: $"))
+    if price is None:
+        print("❌ Invalid ticket price. Please enter an amount such as 12.50.")
+        console.wait_for_user()
+        return
     
+    movie_id = system.add_movie(title, genre, duration, rating, description, price)
+    if movie_id:
+        print(f"✅ Movie added successfully! Movie ID: {movie_id}")
+    else:
+        print("❌ Failed to add movie.")
+    console.wait_for_user()
+
+def handle_remove_movie(system: MovieBookingSystem, console: Console):
+    """Remove a movie (admin)."""
+    movie_id = console.prompt("🎬 Enter movie ID to remove: ")
+    if system.remove_movie(movie_id):
+        print("✅ Movie removed successfully!")
+    else:
+        print("❌ Failed to remove movie.")
+    console.wait_for_user()
+
+def handle_add_showtime(system: MovieBookingSystem, console: Console):
+    """Add a showtime to a movie (admin)."""
+    movie_id = console.prompt("🎬 Enter movie ID: ")
+    hit = system.lookup(movie_id)
+    if not hit or hit[0] != 'movie':
+        print("❌ Invalid movie ID.")
+        console.wait_for_user()
+        return
+
+    date = console.prompt("📅 Enter date (YYYY-MM-DD): ")
+    time = console.prompt("🕐 Enter time (HH:MM): ")
+    theater = console.prompt("🏢 Enter theater name: ")
+    total_seats_input = console.prompt("💺 Enter total seats (default 50): ")
+    total_seats = _parse_int(total_seats_input)
+    if total_seats is None:
+        if total_seats_input:
+            print("❌ Invalid number for total seats. Using default 50.")
+        total_seats = 50
+
+    showtime_id = system.add_showtime(movie_id, date, time, theater, total_seats)
+    if showtime_id:
+        print(f"✅ Showtime added successfully! Showtime ID: {showtime_id}")
+    else:
+        print("❌ Failed to add showtime.")
+    console.wait_for_user()
+
+def handle_remove_showtime(system: MovieBookingSystem, console: Console):
+    """Remove a showtime (admin)."""
+    showtime_id = console.prompt("🎭 Enter showtime ID to remove: ")
+    if system.remove_showtime(showtime_id):
+        print("✅ Showtime removed successfully!")
+    else:
+        print("❌ Failed to remove showtime.")
+    console.wait_for_user()
+
+def handle_all_bookings(system: MovieBookingSystem, console: Console):
+    """Show every booking in the system (admin)."""
+    display_bookings(system.get_all_bookings())
+    console.wait_for_user()
+
+# Menu choice -> handler, for logged-out visitors, users and admins
+GUEST_HANDLERS = MappingProxyType({
+    '1': handle_login,
+    '2': handle_register,
+    '3': handle_exit,
+})
+
+_BOOKING_HANDLERS = {
+    '1': handle_browse,
+    '2': handle_showtimes,
+    '3': handle_book,
+    '4': handle_my_bookings,
+    '5': handle_cancel,
+}
+
+USER_HANDLERS = MappingProxyType({
+    **_BOOKING_HANDLERS,
+    '6': handle_logout,
+})
+
+ADMIN_HANDLERS = MappingProxyType({
+    **_BOOKING_HANDLERS,
+    '6': handle_add_movie,
+    '7': handle_remove_movie,
+    '8': handle_add_showtime,
+    '9': handle_remove_showtime,
+    '10': handle_all_bookings,
+    '11': handle_logout,
+})
+
+def run_menu(system: MovieBookingSystem, console: Console):
+    """Show the menu and dispatch choices until the user exits."""
     while True:
-        print_menu()
-        choice = input("\n🔽 Enter your choice: ").strip()
+        # Snapshot the role once; it can only change inside a handler
+        user = system.current_user
+        is_admin = user is not None and user.is_admin
+        print_menu(system, is_admin)
+        # Interned so the handler table lookup can match keys by identity
+        choice = sys.intern(console.prompt("\n🔽 Enter your choice: "))
         # Easter egg: popcorn
         if choice.lower() == 'popcorn':
             print("🍿 You found the secret popcorn! Enjoy your snack while watching the movie! 🍿")
-            wait_for_user()
+            console.wait_for_user()
             continue
         
-        try:
-            if not system.current_user:
-                if choice == '1':  # Login
-                    username = input("👤 Enter username: ").strip()
-                    if username == 'admin':
-                        password = input("🔑 Enter password for admin: ").strip()
-                        if password != '12345':
-                            print("❌ Incorrect password for admin.")
-                            wait_for_user()
-                            continue
-                    if system.login(username):
-                        print("✅ Login successful!")
-                    else:
-                        print("❌ Invalid username. Please try again.")
-                    wait_for_user()
-                
-                elif choice == '2':  # Register
-                    username = input("👤 Enter username: ").strip()
-                    email = input("📧 Enter email: ").strip()
-                    if system.register_user(username, email):
-                        print("✅ Registration successful! You can now login.")
-                    else:
-                        print("❌ Username already exists. Please choose a different one.")
-                    wait_for_user()
-                
-                elif choice == '3':  # Exit
-                    print("👋 Thank you for using Movie Ticket Booking System!")
-                    break
-                
-                else:
-                    print("❌ Invalid choice. Please try again.")
-                    wait_for_user()
-            
-            else:
-                if choice == '1':  # Browse Movies
-                    display_movies()
-                    wait_for_user()
-                
-                elif choice == '2':  # View Movie Showtimes
-                    movie_id = input("🎬 Enter movie ID: ").strip()
-                    display_showtimes(movie_id)
-                    wait_for_user()
-                
-                elif choice == '3':  # Book Tickets
-                    showtime_id = input("🎭 Enter showtime ID: ").strip()
-                    
-                    # Find and display showtime details
-                    showtime = None
-                    movie = None
-                    for m in system.movies.values():
-                        for st in m.showtimes:
-                            if st.showtime_id == showtime_id:
-                                showtime = st
-                                movie = m
-                                break
-                        if showtime:
-                            break
-                    
-                    if not showtime or not movie:
-                        print("❌ Invalid showtime ID.")
-                        wait_for_user()
-                        continue
-                    
-                    print(get_seat_display(showtime))
-                    print(f"💰 Price per seat: ${movie.price:.2f}")
-                    
-                    seat_input = input("💺 Enter seat(s) (e.g. A,1 or B,2;C,3): ").strip()
-                    # Accept both comma or semicolon as separator for multiple seats
-                    seat_strs = []
-                    # If only one comma, treat as single seat (e.g. B,2)
-                    if ';' in seat_input:
-                        seat_strs = [s.strip() for s in seat_input.split(';') if s.strip()]
-                    elif seat_input.count(',') == 1:
-                        seat_strs = [seat_input.strip()]
-                    elif ',' in seat_input and seat_input.count(',') > 1:
-                        # If user enters A,1,B,2, treat as A,1;B,2
-                        parts = [p.strip() for p in seat_input.split(',')]
-                        seat_strs = [f"{parts[i]},{parts[i+1]}" for i in range(0, len(parts), 2) if i+1 < len(parts)]
-                    else:
-                        seat_strs = [seat_input.strip()] if seat_input else []
-                    seat_numbers = []
-                    invalid_seats = []
-                    booked_seats = []
-                    for seat_str in seat_strs:
-                        if ',' not in seat_str:
-                            invalid_seats.append(seat_str)
-                            continue
-                        row_part, col_part = seat_str.split(',', 1)
-                        row_part = row_part.strip().upper()
-                        col_part = col_part.strip()
-                        if not row_part.isalpha() or not col_part.isdigit():
-                            invalid_seats.append(seat_str)
-                            continue
-                        row = ord(row_part) - ord('A')
-                        col = int(col_part) - 1
-                        if row < 0 or col < 0 or col >= 10:
-                            invalid_seats.append(seat_str)
-                            continue
-                        seat_num = row * 10 + col + 1
-                        if seat_num > showtime.total_seats:
-                            invalid_seats.append(seat_str)
-                            continue
-                        if seat_num in showtime.booked_seats:
-                            booked_seats.append(seat_str)
-                            continue
-                        seat_numbers.append(seat_num)
-                    if invalid_seats:
-                        print(f"❌ Invalid seat(s) format or out of range: {invalid_seats}\n   ➡️  Please enter as A,1 or B,2;C,3 (row letter, column number; separate multiple seats with semicolons or commas)")
-                        wait_for_user()
-                        continue
-                    if booked_seats:
-                        print(f"❌ Seats already booked: {booked_seats}")
-                        wait_for_user()
-                        continue
-                    total_cost = len(seat_numbers) * movie.price
-                    print(f"💰 Total cost: ${total_cost:.2f}")
-                    confirm = input("✅ Confirm booking? (y/n): ").strip().lower()
-                    if confirm == 'y':
-                        booking_id = system.book_tickets(showtime_id, seat_numbers)
-                        if booking_id:
-                            print(f"🎉 Booking successful! Booking ID: {booking_id}")
-                            # Mini-game: Lucky Draw
-                            import random
-                            if random.randint(1, 5) == 3:
-                                print("🎲 Lucky Draw! You won a free popcorn coupon! 🍿 Use code: POPCORN2025")
-                        else:
-                            print("❌ Booking failed. Please try again.")
-                    else:
-                        print("❌ Booking cancelled.")
-                    wait_for_user()
-                
-                elif choice == '4':  # My Bookings
-                    bookings = system.get_user_bookings()
-                    display_bookings(bookings)
-                    wait_for_user()
-                
-                elif choice == '5':  # Cancel Booking
-                    booking_id = input("🎫 Enter booking ID to cancel: ").strip()
-                    if system.cancel_booking(booking_id):
-                        print("✅ Booking cancelled successfully!")
-                    else:
-                        print("❌ Failed to cancel booking. Please check booking ID.")
-                    wait_for_user()
-                
-                elif choice == '6':  # Logout or Add Movie (admin)
-                    if system.current_user.is_admin:
-                        # Add Movie
-                        print("\n➕ ADD NEW MOVIE:")
-                        title = input("🎬 Movie title: ").strip()
-                        genre = input("🎭 Genre: ").strip()
-                        duration = int(input("⏱️ Duration (minutes): ").strip())
-                        rating = input("⭐ Rating (G/PG/PG-13/R): ").strip()
-                        description = input("📝 Description: ").strip()
-                        price = float(input("💰 Ticket price: $").strip())
-                        
-                        movie_id = system.add_movie(title, genre, duration, rating, description, price)
-                        if movie_id:
-                            print(f"✅ Movie added successfully! Movie ID: {movie_id}")
-                        else:
-                            print("❌ Failed to add movie.")
-                        wait_for_user()
-                    else:
-                        # Logout
-                        system.logout()
-                        print("👋 Logged out successfully!")
-                        wait_for_user()
-                
-                elif choice == '7' and system.current_user.is_admin:  # Remove Movie
-                    movie_id = input("🎬 Enter movie ID to remove: ").strip()
-                    if system.remove_movie(movie_id):
-                        print("✅ Movie removed successfully!")
-                    else:
-                        print("❌ Failed to remove movie.")
-                    wait_for_user()
-                
-                elif choice == '8' and system.current_user.is_admin:  # Add Showtime
-                    movie_id = input("🎬 Enter movie ID: ").strip()
-                    if movie_id not in system.movies:
-                        print("❌ Invalid movie ID.")
-                        wait_for_user()
-                        continue
-
-                    date = input("📅 Enter date (YYYY-MM-DD): ").strip()
-                    time = input("🕐 Enter time (HH:MM): ").strip()
-                    theater = input("🏢 Enter theater name: ").strip()
-                    total_seats_input = input("💺 Enter total seats (default 50): ").strip()
-                    if total_seats_input == '':
-                        total_seats = 50
-                    else:
-                        try:
-                            total_seats = int(total_seats_input)
-                        except ValueError:
-                            print("❌ Invalid number for total seats. Using default 50.")
-                            total_seats = 50
-
-                    showtime_id = system.add_showtime(movie_id, date, time, theater, total_seats)
-                    if showtime_id:
-                        print(f"✅ Showtime added successfully! Showtime ID: {showtime_id}")
-                    else:
-                        print("❌ Failed to add showtime.")
-                    wait_for_user()
-                
-                elif choice == '9' and system.current_user.is_admin:  # Remove Showtime
-                    showtime_id = input("🎭 Enter showtime ID to remove: ").strip()
-                    if system.remove_showtime(showtime_id):
-                        print("✅ Showtime removed successfully!")
-                    else:
-                        print("❌ Failed to remove showtime.")
-                    wait_for_user()
-                
-                elif choice == '10' and system.current_user.is_admin:  # View All Bookings
-                    bookings = system.get_all_bookings()
-                    display_bookings(bookings)
-                    wait_for_user()
-                
-                elif choice == '11' and system.current_user.is_admin:  # Logout
-                    system.logout()
-                    print("👋 Logged out successfully!")
-                    wait_for_user()
-                
-                else:
-                    print("❌ Invalid choice. Please try again.")
-                    wait_for_user()
+        if is_admin:
+            handlers = ADMIN_HANDLERS
+        elif user is not None:
+            handlers = USER_HANDLERS
+        else:
+            handlers = GUEST_HANDLERS
         
+        handler = handlers.get(choice)
+        if handler is None:
+            print("❌ Invalid choice. Please try again.")
+            console.wait_for_user()
+        elif handler(system, console):
+            return
+
+def main(argv: Optional[List[str]] = None):
+    """Main application entry point."""
+    parser = argparse.ArgumentParser(description="Movie Ticket Booking System")
+    parser.add_argument("--batch", metavar="PATH",
+                        help="read menu answers from PATH, one per line, without pausing")
+    args = parser.parse_args(argv)
+    
+    if args.batch:
+        with open(args.batch, encoding="utf-8") as batch_file:
+            run_session(Console(batch_file.readline, pause=False))
+    else:
+        run_session(Console())
+
+def run_session(console: Console):
+    """Load the system, greet the user and run the menu until they exit."""
+    system = MovieBookingSystem()
+    
+    print_header()
+    sys.stdout.write("\n".join([
+        "🎭 Welcome to the Movie Ticket Booking System!",
+        "ℹ️  Demo accounts: 'admin' (admin) or 'sudip' (user)",
+        # Easter egg: popcorn command
+        "🍀 Type 'popcorn' at any menu for a surprise!"
+    ]) + "\n")
+    
+    # The menu loop only leaves run_menu on exit or on an unexpected error,
+    # so the error handler is set up once rather than on every choice
+    while True:
+        try:
+            run_menu(system, console)
+            break
+        except EOFError:
+            # Nothing left to read (end of a batch file or a closed stdin)
+            print()
+            break
         except Exception as e:
             print(f"❌ Error: {e}. Please try again.")
-            wait_for_user()
+            console.wait_for_user()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()